@@ -1,3 +1,323 @@
+import numpy as np
+
+from groups.elementary_abelian import SemidirectProductEA
+from groups.finite_field import SemidirectProductZp
+
+
+class _IntHashMap:
+    """
+    Open-addressed hash table mapping packed non-negative int keys to int
+    values, backed by two flat numpy arrays.  Unlike a CPython dict it
+    stores no per-entry PyObjects, so the m ~ sqrt(bound) baby steps cost
+    16 bytes each instead of hundreds.  Keys must fit in a signed 64-bit
+    int; -1 is the empty-slot sentinel.
+    """
+
+    _MULT = 0x9E3779B97F4A7C15  # 2^64 / golden ratio
+
+    def __init__(self, capacity):
+        log2c = max(3, (2 * capacity - 1).bit_length())
+        self._shift = 64 - log2c
+        size = 1 << log2c
+        self._mask = size - 1
+        self._keys = np.full(size, -1, dtype=np.int64)
+        self._vals = np.empty(size, dtype=np.int64)
+
+    def _probe(self, key):
+        return ((key * self._MULT) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def put(self, key, val):
+        keys = self._keys
+        i = self._probe(key)
+        while keys[i] != -1 and keys[i] != key:
+            i = (i + 1) & self._mask
+        keys[i] = key
+        self._vals[i] = val
+
+    def get(self, key):
+        """Return the value stored for key, or -1 if absent."""
+        keys = self._keys
+        i = self._probe(key)
+        while True:
+            k = keys[i]
+            if k == key:
+                return int(self._vals[i])
+            if k == -1:
+                return -1
+            i = (i + 1) & self._mask
+
+
+def _ea_baby_keys(G, u, v, m, start=None):
+    """
+    Build m consecutive baby-step key rows for an elementary abelian
+    group with numpy arithmetic instead of m element multiplications.
+
+    Writing u = (g_u, x1), v = (g_v, x2) and t_j = u^j * v^j = (c_j, y_j),
+    unrolling t_{j+1} = u * t_j * v gives the recurrences
+
+        c_{j+1} = x1 * (c_j + y_j * g_v) + g_u  (mod p)
+        y_{j+1} = x1 * y_j * x2                 (mod p)
+
+    so each step is a handful of small numpy matmuls on uint64 buffers
+    rather than a Python-level _mul_ chain through Sage.  The chain
+    starts at the identity, or at ``start`` when a shard resumes from
+    the middle of the table.
+    """
+    p = np.uint64(G._p)
+    n = G._n
+    x1 = u._xm.astype(np.uint64)
+    x2 = v._xm.astype(np.uint64)
+    g_u = u._gv.astype(np.uint64)
+    g_v = v._gv.astype(np.uint64)
+
+    keys = np.empty((m, n + 1), dtype=np.uint64)
+    if start is None:
+        c = np.zeros(n, dtype=np.uint64)
+        y = np.eye(n, dtype=np.uint64)
+    else:
+        c = start._gv.astype(np.uint64)
+        y = start._xm.astype(np.uint64)
+    for j in range(m):
+        keys[j, :n] = c
+        keys[j, n] = hash(y.astype(np.uint32).tobytes()) & 0xFFFFFFFFFFFFFFFF
+        c = (x1 @ ((c + y @ g_v) % p) + g_u) % p
+        y = ((x1 @ y % p) @ x2) % p
+    return keys
+
+
+_SDLP_EA_SPECIALIZED = {}
+
+
+def _gen_sdlp_ea_core(p, n):
+    """
+    Generate the source of a straight-line BSGS core for a fixed (p, n).
+
+    Both BSGS orbits of the elementary abelian SDLP only move the
+    g-vector by affine maps (the x-parts cancel by the (u, v) contract),
+    so the core iterates c <- A*c + d with the n-dimensional arithmetic
+    fully unrolled and p baked in as a literal: no loops over row
+    indices, no dispatch, just int ops the interpreter sees directly.
+    """
+    names = [f"g_{i}" for i in range(n)]
+    temps = [f"t_{i}" for i in range(n)]
+    key = "(" + ", ".join(names) + ("," if n == 1 else "") + ")"
+
+    def unpack(prefix, flat):
+        if flat:
+            lhs = ", ".join(f"{prefix}_{i}_{k}" for i in range(n)
+                            for k in range(n))
+        else:
+            lhs = ", ".join(f"{prefix}_{i}" for i in range(n))
+        return lhs + ("," if n == 1 else "")
+
+    def step(mat, vec):
+        lines = []
+        for i in range(n):
+            terms = " + ".join(f"{mat}_{i}_{k}*{names[k]}" for k in range(n))
+            lines.append(f"        {temps[i]} = ({terms} + {vec}_{i}) % {p}")
+        lines.append(f"        {', '.join(names)} = {', '.join(temps)}")
+        return lines
+
+    src = ["def _core(a, d, b, e, w, m):"]
+    src.append(f"    {unpack('a', True)} = a")
+    src.append(f"    {unpack('d', False)} = d")
+    src.append(f"    {' = '.join(names)} = 0")
+    src.append("    T = {}")
+    src.append("    for j in range(m):")
+    src.append(f"        T[{key}] = j")
+    src.extend(step("a", "d"))
+    src.append(f"    {unpack('b', True)} = b")
+    src.append(f"    {unpack('e', False)} = e")
+    src.append(f"    {unpack('g', False)} = w")
+    src.append("    get = T.get")
+    src.append("    for i in range(m):")
+    src.append(f"        hit = get({key})")
+    src.append("        if hit is not None:")
+    src.append("            return i * m + hit")
+    src.extend(step("b", "e"))
+    src.append("    return None")
+    return "\n".join(src)
+
+
+def make_bsgs_sdlp_eag(p, n):
+    """
+    Return a bsgs_sdlp specialized at runtime for SemidirectProductEA(p, n).
+
+    The returned function has the same signature and contract as
+    bsgs_sdlp (in particular base = (u, v) with v = (g_v, sigma^-1), so
+    the x-parts cancel along both orbits).  The inner loops are exec'd
+    from generated source with n unrolled and p a literal; compiled
+    solvers are cached per (p, n).
+    """
+    try:
+        return _SDLP_EA_SPECIALIZED[(p, n)]
+    except KeyError:
+        pass
+
+    namespace = {}
+    exec(_gen_sdlp_ea_core(p, n), namespace)
+    core = namespace["_core"]
+
+    def specialized(G, w, base, bound):
+        from math import ceil, sqrt
+
+        u, v = base
+        m = ceil(sqrt(bound))
+        um_inv, vm_inv = _sdlp_giant_increments(G, u, v, m)
+
+        p64 = np.uint64(p)
+        x1 = u._xm.astype(np.uint64)
+        xg = um_inv._xm.astype(np.uint64)
+        # Collapse u * t * v to the affine map t <- A*t + d on the
+        # g-vector (and likewise for the giant-step increments).
+        d = (x1 @ v._gv.astype(np.uint64) + u._gv) % p64
+        e = (xg @ vm_inv._gv.astype(np.uint64) + um_inv._gv) % p64
+
+        result = core(
+            [int(c) for c in u._xm.ravel()],
+            [int(c) for c in d],
+            [int(c) for c in um_inv._xm.ravel()],
+            [int(c) for c in e],
+            [int(c) for c in w._gv],
+            m,
+        )
+        if result is None:
+            raise ValueError(
+                f"Log of {w} to the base {base} does not exist "
+                f"up to bound {bound}."
+            )
+        return result
+
+    _SDLP_EA_SPECIALIZED[(p, n)] = specialized
+    return specialized
+
+
+# Below this many baby steps the fork/pickle overhead of sharding
+# outweighs the loop work.
+_PARALLEL_THRESHOLD = 1 << 16
+
+
+def _shard_bounds(m, k):
+    """Split range(m) into at most k contiguous (offset, count) shards."""
+    k = min(k, m)
+    q, r = divmod(m, k)
+    bounds = []
+    offset = 0
+    for s in range(k):
+        count = q + (1 if s < r else 0)
+        bounds.append((offset, count))
+        offset += count
+    return bounds
+
+
+def _baby_shard(args):
+    G, u, v, start, count = args
+    return _ea_baby_keys(G, u, v, count, start=start)
+
+
+def _giant_shard(args):
+    G, temp, um_inv, vm_inv, i0, count, m, sorted_records, order = args
+    for i in range(i0, i0 + count):
+        probe = _row_records(G._pack(temp).reshape(1, -1))[0]
+        idx = np.searchsorted(sorted_records, probe)
+        if idx < len(sorted_records) and sorted_records[idx] == probe:
+            return i * m + int(order[idx])
+        temp = um_inv * temp * vm_inv
+    return None
+
+
+def _bsgs_sdlp_ea_parallel(G, w, base, m, bound, processes):
+    """
+    Sharded bsgs_sdlp for the elementary abelian group: both loops are
+    embarrassingly parallel over disjoint index ranges, so split them
+    into per-process chunks.  Shard s starts its chain at u^j0 * v^j0
+    (resp. um_inv^i0 * w * vm_inv^i0), computed by stepping the previous
+    shard's start with one windowed power per chunk.
+    """
+    import multiprocessing as mp
+
+    u, v = base
+    mul = lambda a, b: a * b
+    one = G.one()
+
+    if "fork" in mp.get_all_start_methods():
+        ctx = mp.get_context("fork")
+    else:
+        ctx = mp.get_context()
+    k = processes if processes else mp.cpu_count()
+    bounds = _shard_bounds(m, k)
+
+    with ctx.Pool(len(bounds)) as pool:
+        # Baby steps: disjoint table segments, concatenated afterwards.
+        start = one
+        baby_args = []
+        for j0, count in bounds:
+            baby_args.append((G, u, v, start, count))
+            if j0 + count < m:
+                uc = _pow_windowed(u, count, mul, one)
+                vc = _pow_windowed(v, count, mul, one)
+                start = uc * start * vc
+        keys = np.vstack(pool.map(_baby_shard, baby_args))
+
+        records = _row_records(keys)
+        order = np.argsort(records)
+        sorted_records = records[order]
+
+        um_inv, vm_inv = _sdlp_giant_increments(G, u, v, m)
+
+        # Giant steps: disjoint target sequences, first match wins.
+        temp = w
+        giant_args = []
+        for i0, count in bounds:
+            giant_args.append((G, temp, um_inv, vm_inv, i0, count, m,
+                               sorted_records, order))
+            if i0 + count < m:
+                uc = _pow_windowed(um_inv, count, mul, one)
+                vc = _pow_windowed(vm_inv, count, mul, one)
+                temp = uc * temp * vc
+        for result in pool.imap(_giant_shard, giant_args):
+            if result is not None:
+                pool.terminate()
+                return result
+
+    raise ValueError(
+        f"Log of {w} to the base {base} does not exist up to bound {bound}."
+    )
+
+
+def _row_records(keys):
+    """
+    View each row of a 2-D uint64 key array as a single comparable record,
+    so whole rows can be sorted and binary-searched in C.
+    """
+    dtype = np.dtype([("", np.uint64)] * keys.shape[1])
+    return np.ascontiguousarray(keys).view(dtype).ravel()
+
+
+def _pow_windowed(base, exp, mul, one, precomp=None):
+    """
+    Compute base^exp with 4-bit windowed square-and-multiply, using ``mul``
+    for the group law.  ``precomp`` may supply [one, base, ..., base^15]
+    (e.g. reused from the baby-step loop); it is built on demand otherwise.
+    Roughly halves the number of multiplications versus binary expo.
+    """
+    if precomp is None:
+        precomp = [one]
+        for _ in range(15):
+            precomp.append(mul(precomp[-1], base))
+
+    result = one
+    for shift in range(4 * ((exp.bit_length() + 3) // 4) - 4, -1, -4):
+        result = mul(result, result)
+        result = mul(result, result)
+        result = mul(result, result)
+        result = mul(result, result)
+        nibble = (exp >> shift) & 0xF
+        if nibble:
+            result = mul(result, precomp[nibble])
+    return result
+
+
 def bsgs_dlp(G, h, g, bound, operation="*"):
     """
     Baby-Step Giant-Step algorithm for discrete logarithm problem.
@@ -19,12 +339,19 @@ def bsgs_dlp(G, h, g, bound, operation="*"):
     T = {}
     
     if operation == "*":
-        temp = G(1)
+        one = G(1)
+        precomp = []
+        temp = one
         for i in range(m):
             T[temp] = i
+            if i < 16:
+                # First 16 powers double as the window for _pow_windowed.
+                precomp.append(temp)
             temp = temp * g
-        
-        gm_inv = g**(-m)
+
+        if len(precomp) < 16:
+            precomp = None
+        gm_inv = ~_pow_windowed(g, m, lambda a, b: a * b, one, precomp)
         temp = h
         for i in range(m):
             if temp in T:
@@ -51,38 +378,99 @@ def bsgs_dlp(G, h, g, bound, operation="*"):
         f"Log of {h} to the base {g} does not exist up to the bound {bound}."
     )
 
-def bsgs_sdlp(G, w, base, bound):
+def _sdlp_giant_increments(G, u, v, m):
+    """Compute the giant-step increments u^(-m), v^(-m) via windowed expo."""
+    mul = lambda a, b: a * b
+    one = G.one()
+    um_inv = ~_pow_windowed(u, m, mul, one)
+    vm_inv = ~_pow_windowed(v, m, mul, one)
+    return um_inv, vm_inv
+
+
+def bsgs_sdlp(G, w, base, bound, processes=None):
     """
     Baby-Step Giant-Step algorithm for semidirect discrete logarithm problem.
     Given a group G, an element w, a base (u,v) and a bound, this function
     returns the discrete logarithm t such that u^t*v^t=w.
-    
+
     Parameters:
     G - The semidirect product group
     w - The target element
     base - A tuple (u, v) where u corresponds to (g, sigma) and v to (1, sigma^-1)
     bound - Upper bound for the discrete log
+    processes - Worker count for the sharded path on large instances
+                (None: one per CPU, 1: stay serial)
     """
     from math import ceil, sqrt
-    
+
     u, v = base
     m = ceil(sqrt(bound))
-    T = {}
-    temp = G.one()
-    for j in range(m):
-        T[temp] = j
-        temp = u * temp * v
-    
-    um_inv = u**(-m)
-    vm_inv = v**(-m)
-    
-    temp = w
-    for i in range(m):
-        if temp in T:
-            # Found a match, return the discrete log
-            return i * m + T[temp]
-        temp = um_inv * temp * vm_inv
-    
+
+    if (isinstance(G, SemidirectProductEA) and processes != 1
+            and m > _PARALLEL_THRESHOLD):
+        return _bsgs_sdlp_ea_parallel(G, w, base, m, bound, processes)
+
+    if isinstance(G, SemidirectProductZp) and 2 * G._pi.bit_length() <= 63:
+        # Both components are ints in [0, p), so an element packs into one
+        # 64-bit key and the whole table fits in two numpy arrays.
+        bits = G._pi.bit_length()
+        T = _IntHashMap(m)
+        temp = G.one()
+        for j in range(m):
+            T.put((int(temp._gi) << bits) | int(temp._xi), j)
+            temp = u * temp * v
+
+        um_inv, vm_inv = _sdlp_giant_increments(G, u, v, m)
+
+        temp = w
+        for i in range(m):
+            j = T.get((int(temp._gi) << bits) | int(temp._xi))
+            if j >= 0:
+                return i * m + j
+            temp = um_inv * temp * vm_inv
+
+    elif hasattr(G, "_pack"):
+        # Store packed uint64 keys in a sorted numpy array instead of a dict
+        # of group elements: tens of bytes per entry instead of hundreds, and
+        # lookups are binary searches done in C.
+        if isinstance(G, SemidirectProductEA):
+            keys = _ea_baby_keys(G, u, v, m)
+        else:
+            keys = np.empty((m, len(G._pack(G.one()))), dtype=np.uint64)
+            temp = G.one()
+            for j in range(m):
+                keys[j] = G._pack(temp)
+                temp = u * temp * v
+
+        records = _row_records(keys)
+        order = np.argsort(records)
+        sorted_records = records[order]
+
+        um_inv, vm_inv = _sdlp_giant_increments(G, u, v, m)
+
+        temp = w
+        for i in range(m):
+            probe = _row_records(G._pack(temp).reshape(1, -1))[0]
+            idx = np.searchsorted(sorted_records, probe)
+            if idx < m and sorted_records[idx] == probe:
+                return i * m + int(order[idx])
+            temp = um_inv * temp * vm_inv
+    else:
+        T = {}
+        temp = G.one()
+        for j in range(m):
+            T[temp] = j
+            temp = u * temp * v
+
+        um_inv, vm_inv = _sdlp_giant_increments(G, u, v, m)
+
+        temp = w
+        for i in range(m):
+            if temp in T:
+                # Found a match, return the discrete log
+                return i * m + T[temp]
+            temp = um_inv * temp * vm_inv
+
     raise ValueError(
         f"Log of {w} to the base {base} does not exist up to bound {bound}."
     )
@@ -0,0 +1,66 @@
+"""
+Compiled arithmetic kernels for the elementary abelian semidirect product.
+
+The group law (g1, x1) * (g2, x2) = (g1 + x1*g2, x1*x2) is a mod-p
+vector/matrix multiply; the BSGS loops call it O(sqrt(bound)) times, so
+it is done here on flat uint32 buffers instead of Sage objects.  The
+best available backend is picked at import time: a numba-JIT'd kernel,
+then FLINT's nmod_mat via python-flint, then vectorised numpy.
+Coordinates are < p < 2^30, so products accumulate safely in uint64.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is None:
+    try:
+        import flint as _flint
+    except ImportError:
+        _flint = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def mul(g1, x1, g2, x2, p, out_g, out_x):
+        """out_g = (g1 + x1 @ g2) mod p; out_x = (x1 @ x2) mod p."""
+        n = g1.shape[0]
+        for i in range(n):
+            acc = np.uint64(g1[i])
+            for k in range(n):
+                acc += np.uint64(x1[i, k]) * np.uint64(g2[k])
+            out_g[i] = acc % p
+        for i in range(n):
+            for j in range(n):
+                acc = np.uint64(0)
+                for k in range(n):
+                    acc += np.uint64(x1[i, k]) * np.uint64(x2[k, j])
+                out_x[i, j] = acc % p
+
+elif _flint is not None:
+
+    def mul(g1, x1, g2, x2, p, out_g, out_x):
+        """out_g = (g1 + x1 @ g2) mod p; out_x = (x1 @ x2) mod p."""
+        n = g1.shape[0]
+        pi = int(p)
+        a = _flint.nmod_mat(n, n, [int(v) for v in x1.ravel()], pi)
+        b = _flint.nmod_mat(n, n, [int(v) for v in x2.ravel()], pi)
+        col = _flint.nmod_mat(n, 1, [int(v) for v in g2], pi)
+        xg = a * col
+        xx = a * b
+        for i in range(n):
+            out_g[i] = (int(g1[i]) + int(xg[i, 0])) % pi
+            for j in range(n):
+                out_x[i, j] = int(xx[i, j])
+
+else:
+
+    def mul(g1, x1, g2, x2, p, out_g, out_x):
+        """out_g = (g1 + x1 @ g2) mod p; out_x = (x1 @ x2) mod p."""
+        x1_64 = x1.astype(np.uint64)
+        out_g[:] = (g1 + x1_64 @ g2.astype(np.uint64)) % p
+        out_x[:] = (x1_64 @ x2.astype(np.uint64)) % p
@@ -1,36 +1,109 @@
+import numpy as np
+
 from sage.all import GF, GL, VectorSpace, Parent, UniqueRepresentation, Groups
 from sage.structure.element import Element
 
+try:
+    from groups import _ea_kernels
+except ImportError:
+    # Running this file directly as a script.
+    import _ea_kernels
+
 class SemidirectProductElementEA(Element):
-    def __init__(self, parent, g, x):
+    # No instance __dict__: a Sage Element subclass otherwise costs ~300B
+    # per instance, and BSGS keeps m ~ sqrt(bound) of these alive at once.
+    __slots__ = ('_gv', '_xm', '_key', '_hash', '_xh')
+
+    def __init__(self, parent, g, x, gv=None, xm=None):
         Element.__init__(self, parent)
-        self.g = g
-        self.x = x
-        
+        # Only the flat uint32 buffers are stored; the Sage vector/matrix
+        # views are rebuilt on demand by the g and x properties.
+        if gv is None:
+            gv = g.numpy(dtype=np.uint32)
+        if xm is None:
+            xm = x.matrix().numpy(dtype=np.uint32)
+        self._gv = gv
+        self._xm = xm
+        self._rekey()
+
+    @staticmethod
+    def _make(parent, gv, xm):
+        """Build an element from uint32 buffers, skipping Parent.__call__."""
+        elem = SemidirectProductElementEA.__new__(SemidirectProductElementEA)
+        Element.__init__(elem, parent)
+        elem._gv = gv
+        elem._xm = xm
+        elem._rekey()
+        return elem
+
+    def _rekey(self):
+        # Canonical byte key, hashed once: BSGS probes the table ~2m times
+        # and each probe would otherwise rebuild a tuple of field elements.
+        self._key = self._gv.tobytes() + self._xm.tobytes()
+        self._hash = hash(self._key)
+        self._xh = hash(self._xm.tobytes()) & 0xFFFFFFFFFFFFFFFF
+
+    @property
+    def g(self):
+        return self.parent()._V(self._gv.tolist())
+
+    @g.setter
+    def g(self, value):
+        if isinstance(value, np.ndarray):
+            self._gv = value.astype(np.uint32)
+        else:
+            self._gv = value.numpy(dtype=np.uint32)
+        self._rekey()
+
+    @property
+    def x(self):
+        return self.parent()._M(self._xm.tolist())
+
+    @x.setter
+    def x(self, value):
+        if isinstance(value, np.ndarray):
+            self._xm = value.astype(np.uint32)
+        else:
+            self._xm = value.matrix().numpy(dtype=np.uint32)
+        self._rekey()
+
+    def __reduce__(self):
+        # Needed for multiprocessing: rebuild from the parent (which
+        # pickles via UniqueRepresentation) and the raw buffers.
+        return (_unpickle_element_ea, (self.parent(), self._gv, self._xm))
+
     def _repr_(self):
         return f"({self.g}, {self.x})"
-        
+
     def _mul_(self, other):
-        g1, x1 = self.g, self.x
-        g2, x2 = other.g, other.x
-        new_g = g1 + x1 * g2
-        new_x = x1 * x2
-        
-        return self.parent()(new_g, new_x)
+        P = self.parent()
+        # The output buffers become the new element's storage, so the
+        # kernel call is the only allocation on this path.
+        out_g = np.empty_like(self._gv)
+        out_x = np.empty_like(self._xm)
+        _ea_kernels.mul(self._gv, self._xm, other._gv, other._xm,
+                        P._p64, out_g, out_x)
+
+        return self._make(P, out_g, out_x)
 
     def __hash__(self):
-        return hash((tuple(self.g), self.x))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, SemidirectProductElementEA):
             return False
-        return self.g == other.g and self.x == other.x
+        return self._key == other._key
     
     def __invert__(self):
         new_x = self.x**-1
         new_g = -(new_x * self.g)
-        
-        return self.parent()(new_g, new_x)
+
+        return self._make(self.parent(),
+                          new_g.numpy(dtype=np.uint32),
+                          new_x.matrix().numpy(dtype=np.uint32))
+
+def _unpickle_element_ea(parent, gv, xm):
+    return SemidirectProductElementEA._make(parent, gv, xm)
 
 class SemidirectProductEA(Parent, UniqueRepresentation):
     Element = SemidirectProductElementEA
@@ -44,16 +117,29 @@ class SemidirectProductEA(Parent, UniqueRepresentation):
             n: Dimension of the vector space
         """
         self._p = p
+        self._p64 = np.uint64(p)
         self._n = n
         self._base_ring = GF(p)
         self._V = VectorSpace(self._base_ring, n)
         self._M = GL(n, self._base_ring)
-        
+
         Parent.__init__(self, category=Groups().Finite())
-        
-    def _element_constructor_(self, g, x):
-        return self.element_class(self, g, x)
-    
+
+    def _element_constructor_(self, g, x, gv=None, xm=None):
+        return self.element_class(self, g, x, gv=gv, xm=xm)
+
+    def _pack(self, elem):
+        """
+        Pack an element into a row of n+1 uint64 keys for the BSGS table.
+
+        The first n entries are the coordinates of elem.g (each < p < 2^64),
+        the last is a canonical id for elem.x derived from its hash.
+        """
+        row = np.empty(self._n + 1, dtype=np.uint64)
+        row[:self._n] = elem._gv
+        row[self._n] = elem._xh
+        return row
+
     def base_ring(self):
         return self._base_ring
 
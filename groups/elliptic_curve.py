@@ -6,20 +6,33 @@ class SemidirectProductElementEC(Element):
         Element.__init__(self, parent)
         self.g = g
         self.x = x
-        
+        # Hashed once: BSGS probes the table ~2m times per element and
+        # would otherwise rebuild and re-hash this tuple on every probe.
+        self._hash = hash((g, x))
+
+    @staticmethod
+    def _make(parent, g, x):
+        """Build an element directly, skipping Parent.__call__."""
+        elem = SemidirectProductElementEC.__new__(SemidirectProductElementEC)
+        Element.__init__(elem, parent)
+        elem.g = g
+        elem.x = x
+        elem._hash = hash((g, x))
+        return elem
+
     def _repr_(self):
         return f"({self.g}, {self.x.rational_maps()})"
-        
+
     def _mul_(self, other):
         g1, x1 = self.g, self.x
         g2, x2 = other.g, other.x
         new_g = g1 + x1(g2)
         new_x = x1 * x2
-        
-        return self.parent()(new_g, new_x)
+
+        return self._make(self.parent(), new_g, new_x)
 
     def __hash__(self):
-        return hash((self.g, self.x))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, SemidirectProductElementEC):
@@ -29,8 +42,8 @@ class SemidirectProductElementEC(Element):
     def __invert__(self):
         new_x = self.x**-1
         new_g = -new_x(self.g)
-        
-        return self.parent()(new_g, new_x)
+
+        return self._make(self.parent(), new_g, new_x)
 
 class SemidirectProductEC(Parent, UniqueRepresentation):
     Element = SemidirectProductElementEC
@@ -45,7 +58,10 @@ class SemidirectProductEC(Parent, UniqueRepresentation):
         self._E = E
         self._base_ring = E.base_ring()
         self._p = self._base_ring.characteristic()
-        
+        # E.automorphisms() re-derives the automorphism group on every
+        # call; enumerate it once here.
+        self._autos = tuple(E.automorphisms())
+
         Parent.__init__(self, category=Groups().Finite())
         
     def _element_constructor_(self, g, x):
@@ -55,7 +71,7 @@ class SemidirectProductEC(Parent, UniqueRepresentation):
         return self._base_ring
 
     def order(self):
-        return (self._E.order()) * len(self._E.automorphisms())
+        return (self._E.order()) * len(self._autos)
     
     def _repr_(self):
         return f"Semidirect product of E(F_{self._p}) x Aut(E(F_{self._p}))"
@@ -63,11 +79,11 @@ class SemidirectProductEC(Parent, UniqueRepresentation):
     def random_element(self):
         from random import choice
         g = self._E.random_element()
-        x = choice(self._E.automorphisms())
+        x = choice(self._autos)
         return self(g, x)
-    
+
     def one(self):
-        return self(self._E(0), self._E.automorphisms()[0])
+        return self(self._E(0), self._autos[0])
 
 if __name__ == "__main__":
     from sage.all import EllipticCurve, GF, random_prime
@@ -1,37 +1,66 @@
-from sage.all import IntegerModRing, Zmod, ZZ, gcd, random_prime, euler_phi, Groups, Parent, UniqueRepresentation
+from gmpy2 import invert, mpz, powmod
+
+from sage.all import IntegerModRing, Zmod, gcd, random_prime, euler_phi, Groups, Parent, UniqueRepresentation
 from sage.structure.element import Element
 
 
 class SemidirectProductElementZp(Element):
     def __init__(self, parent, g, x):
         Element.__init__(self, parent)
-        self.g = parent._base_ring(g)
-        self.x = Zmod(parent._p - 1)(x)
-        
+        # gmpy2 mpz values; the hot path in _mul_ only touches these and
+        # GMP's powmod, never Sage's IntegerModRing coercion.
+        self._gi = mpz(int(g)) % parent._pi
+        self._xi = mpz(int(x)) % parent._pm1
+
+    @staticmethod
+    def _make(parent, gi, xi):
+        """Build an element from reduced mpz, skipping Parent.__call__."""
+        elem = SemidirectProductElementZp.__new__(SemidirectProductElementZp)
+        Element.__init__(elem, parent)
+        elem._gi = gi
+        elem._xi = xi
+        return elem
+
+    @property
+    def g(self):
+        return self.parent()._base_ring(int(self._gi))
+
+    @g.setter
+    def g(self, value):
+        self._gi = mpz(int(value)) % self.parent()._pi
+
+    @property
+    def x(self):
+        return Zmod(int(self.parent()._pm1))(int(self._xi))
+
+    @x.setter
+    def x(self, value):
+        self._xi = mpz(int(value)) % self.parent()._pm1
+
     def _repr_(self):
         return f"({self.g}, {self.x})"
-        
+
     def _mul_(self, other):
-        g1, x1 = self.g, self.x
-        g2, x2 = other.g, other.x
-        new_g = ZZ(g1 * g2**x1)
-        new_x = (x1 * x2)
-        
-        return self.parent()(new_g, new_x)
-    
+        P = self.parent()
+        new_g = (self._gi * powmod(other._gi, self._xi, P._pi)) % P._pi
+        new_x = (self._xi * other._xi) % P._pm1
+
+        return self._make(P, new_g, new_x)
+
     def __hash__(self):
-        return hash((self.g, self.x))
+        return hash((self._gi, self._xi))
 
     def __eq__(self, other):
         if not isinstance(other, SemidirectProductElementZp):
             return False
-        return self.g == other.g and self.x == other.x
-    
+        return self._gi == other._gi and self._xi == other._xi
+
     def __invert__(self):
-        new_x = pow(self.x, -1, self.parent()._p-1)
-        new_g = pow(self.g, -new_x, self.parent()._p)
-        
-        return self.parent()(new_g, new_x)
+        P = self.parent()
+        new_x = invert(self._xi, P._pm1)
+        new_g = powmod(self._gi, -new_x, P._pi)
+
+        return self._make(P, new_g, new_x)
 
 class SemidirectProductZp(Parent, UniqueRepresentation):
     Element = SemidirectProductElementZp
@@ -44,8 +73,10 @@ class SemidirectProductZp(Parent, UniqueRepresentation):
             p: prime modulo p
         """
         self._p = p
+        self._pi = mpz(int(p))
+        self._pm1 = self._pi - 1
         self._base_ring = IntegerModRing(p)
-        
+
         Parent.__init__(self, category=Groups().Finite())
         
     def _element_constructor_(self, g, x):
@@ -16,7 +16,7 @@ from sage.all import (
     matrix,
 )
 
-from bsgs import bsgs_dlp, bsgs_sdlp
+from bsgs import bsgs_dlp, bsgs_sdlp, make_bsgs_sdlp_eag
 from period import find_period
 from groups.finite_field import SemidirectProductZp
 from groups.elementary_abelian import SemidirectProductEA
@@ -115,6 +115,8 @@ def test_elementary_abelian(p=None, n=3):
     print(f"Testing with p = {p}, n = {n}")
 
     G = SemidirectProductEA(p, n)
+    # SDLP solver specialized (via runtime codegen) for this (p, n).
+    sdlp_solver = make_bsgs_sdlp_eag(p, n)
     print("\n--- Standard DLP ---")
     print("DLP: Skipped (O(1) complexity in vector spaces)")
 
@@ -146,7 +148,7 @@ def test_elementary_abelian(p=None, n=3):
     w.g = target.g
 
     start_time = time.time()
-    found_t = bsgs_sdlp(G, w, (u, v), period)
+    found_t = sdlp_solver(G, w, (u, v), period)
     sdlp_time = time.time() - start_time
     print(f"SDLP: Found t = {found_t}, expected = {t % period}")
     assert found_t == t % period
@@ -177,7 +179,7 @@ def test_elementary_abelian(p=None, n=3):
     w.g = target.g
 
     start_time = time.time()
-    found_t = bsgs_sdlp(G, w, (u, v), period)
+    found_t = sdlp_solver(G, w, (u, v), period)
     sdlp_time = time.time() - start_time
     print(f"SDLP: Found t = {found_t}, expected = {t % period}")
     assert found_t == t % period
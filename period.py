@@ -1,25 +1,62 @@
 from sage.all import ZZ
 
+def _pow(u, e, squares):
+    """
+    Compute u^e by square-and-multiply directly over the group's _mul_.
+
+    ``squares`` is a shared list [u, u^2, u^4, ...] extended on demand, so
+    successive calls for different exponents of the same base reuse the
+    one squaring chain instead of redoing it inside Sage's generic pow.
+    """
+    e = int(e)
+    if e == 0:
+        return u.parent().one()
+    result = None
+    k = 0
+    while e:
+        if e & 1:
+            while k >= len(squares):
+                squares.append(squares[-1] * squares[-1])
+            s = squares[k]
+            result = s if result is None else result * s
+        e >>= 1
+        k += 1
+    return result
+
 def find_period(u, n):
     """
     Finds the period of the cycle X_{g,sigma} for a given element (g, sigma) := u
     in a semidirect product group.
-    
+
     Args:
         g: base element g
         n: An upper bound for the period
-        
+
     Returns:
         The period r of the cycle
     """
     length = ZZ(n)
-    for p, e in length.factor():
+    squares = [u]
+    # The identity is rebuilt through the full Parent coercion on every
+    # call to one(); construct it once and compare against its g part.
+    one_g = u.parent().one().g
+
+    # Batch prefilter: if u^(length/p) != 1 for the full bound, then
+    # u^(l/p) != 1 for every divisor l of length as well, so p can never
+    # be divided out.  Testing all primes up front against one shared
+    # squaring ladder prunes them before the sequential reduction.
+    candidates = [
+        (p, e) for p, e in length.factor()
+        if _pow(u, length // p, squares).g == one_g
+    ]
+
+    for p, e in candidates:
         while e > 0:
             l = length // p
-            if (u**l).g == u.parent().one().g:
+            if _pow(u, l, squares).g == one_g:
                 length //= p
                 e -= 1
             else:
                 break
-    
-    return length
\ No newline at end of file
+
+    return length